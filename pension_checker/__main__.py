@@ -1,58 +1,117 @@
-import argparse
-import csv
-import sys
-from pathlib import Path
-
-import xmlschema
-
-from .checkers import Checker
-
-
-def check_file(file: Path, schema: xmlschema.XMLSchema, out_dir: Path) -> None:
-    if file.suffix != ".xml":
-        print(f"{file} is not an XML file", file=sys.stderr)
-        sys.exit(1)
-    out_file = file.stem + ".csv"
-    out_path = out_dir / out_file
-
-    try:
-        problems = Checker.all_checks(str(file), schema)
-    except Exception as e:
-        print(f"Failed to check {file}.\n{e}")
-        return
-
-    with open(out_path, "w", encoding="utf_8_sig", newline="") as f:
-        writer = csv.writer(f, dialect="excel")
-        writer.writerow(("נתיב בקובץ", "מספר סידורי", "בעיה"))
-        writer.writerows(problems)
-
-
-def main():
-    schema = xmlschema.XMLSchema(
-        str(
-            Path(__file__).parent.parent
-            / "MivneAchid_Holdings_KarnotPensiaHadashot_XSD_Schema_008.xsd"
-        )
-    )
-
-    parser = argparse.ArgumentParser()
-    parser.add_argument("input", type=str, nargs="+", help="input file or dir")
-    parser.add_argument("--out", default=".", help="output directory")
-
-    args = parser.parse_args()
-    out_dir = Path(args.out)
-    if not out_dir.is_dir():
-        print(f"{out_dir} is not a directory")
-        sys.exit(1)
-
-    for file_or_dir in map(Path, args.input):
-        if file_or_dir.is_dir():
-            for file in file_or_dir.iterdir():
-                if file.suffix == ".xml":
-                    check_file(file, schema, out_dir)
-        else:
-            check_file(file_or_dir, schema, out_dir)
-
-
-if __name__ == "__main__":
-    main()
+import argparse
+import csv
+import functools
+import hashlib
+import io
+import pickle
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+import xmlschema
+
+from .checkers import Checker
+
+XSD_PATH = Path(__file__).parent.parent / "MivneAchid_Holdings_KarnotPensiaHadashot_XSD_Schema_008.xsd"
+
+CACHE_DIR = Path.home() / ".cache" / "pension_checker"
+
+_worker_schema = None
+
+
+def load_schema(xsd_path: Path) -> xmlschema.XMLSchema:
+    """Build the schema from the XSD, caching the compiled object on disk.
+
+    Compiling the XSD is an order of magnitude slower than unpickling the
+    result, so cache it keyed on the XSD path, mtime and size. Any cache
+    failure (stale pickle, unwritable directory) falls back to a rebuild.
+    """
+    stat = xsd_path.stat()
+    key = f"{xsd_path}:{stat.st_mtime_ns}:{stat.st_size}"
+    cache_path = CACHE_DIR / f"schema-{hashlib.sha256(key.encode()).hexdigest()}.pkl"
+    if cache_path.is_file():
+        try:
+            with open(cache_path, "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            pass
+    schema = xmlschema.XMLSchema(str(xsd_path))
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, "wb") as f:
+            pickle.dump(schema, f)
+    except Exception:
+        pass
+    return schema
+
+
+def check_file(file: Path, schema: Optional[xmlschema.XMLSchema], out_dir: Path) -> None:
+    if file.suffix != ".xml":
+        print(f"{file} is not an XML file", file=sys.stderr)
+        sys.exit(1)
+    out_file = file.stem + ".csv"
+    out_path = out_dir / out_file
+
+    try:
+        problems = Checker.all_checks(str(file), schema)
+    except Exception as e:
+        print(f"Failed to check {file}.\n{e}")
+        return
+
+    # Format the whole report in memory and flush it with one write instead
+    # of issuing many small write() syscalls through the csv writer.
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, dialect="excel")
+    writer.writerow(("נתיב בקובץ", "מספר סידורי", "בעיה"))
+    writer.writerows(problems)
+    with open(out_path, "w", encoding="utf_8_sig", newline="") as f:
+        f.write(buffer.getvalue())
+
+
+def init_worker(xsd_path: Optional[Path]) -> None:
+    global _worker_schema
+    _worker_schema = load_schema(xsd_path) if xsd_path is not None else None
+
+
+def check_file_worker(file: Path, out_dir: Path) -> None:
+    check_file(file, _worker_schema, out_dir)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("input", type=str, nargs="+", help="input file or dir")
+    parser.add_argument("--out", default=".", help="output directory")
+    parser.add_argument(
+        "--validate",
+        action="store_true",
+        help="validate inputs against the XSD while checking (slower)",
+    )
+
+    args = parser.parse_args()
+    out_dir = Path(args.out)
+    if not out_dir.is_dir():
+        print(f"{out_dir} is not a directory")
+        sys.exit(1)
+
+    files = []
+    for file_or_dir in map(Path, args.input):
+        if file_or_dir.is_dir():
+            files.extend(file for file in file_or_dir.iterdir() if file.suffix == ".xml")
+        else:
+            files.append(file_or_dir)
+
+    xsd_path = XSD_PATH if args.validate else None
+    if len(files) <= 1:
+        schema = load_schema(XSD_PATH) if args.validate else None
+        for file in files:
+            check_file(file, schema, out_dir)
+    else:
+        with ProcessPoolExecutor(initializer=init_worker, initargs=(xsd_path,)) as executor:
+            worker = functools.partial(check_file_worker, out_dir=out_dir)
+            for _ in executor.map(worker, files):
+                pass
+
+
+if __name__ == "__main__":
+    main()
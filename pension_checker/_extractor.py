@@ -0,0 +1,128 @@
+"""Specialized extractor for MivneAchid_Holdings_KarnotPensiaHadashot_XSD_Schema_008.xsd.
+
+Generated by tools/generate_extractor.py - do not edit by hand.
+
+Converts lxml elements of the subtrees the checkers consume into the same
+dict trees the schema-driven decoder produces, with xsd:decimal values
+scaled to integer hundredths.
+"""
+from lxml import etree
+
+_XSI_NIL = "{http://www.w3.org/2001/XMLSchema-instance}nil"
+_NIL = {"@xsi:nil": "true"}
+
+
+def _int(element):
+    if element.get(_XSI_NIL) is not None:
+        return _NIL
+    # Numeric XSD types collapse whitespace; real feeds pad values.
+    return int(element.text.strip())
+
+
+def _cents(element):
+    if element.get(_XSI_NIL) is not None:
+        return _NIL
+    text = element.text.strip()
+    if "." in text:
+        whole, _, frac = text.partition(".")
+        return int(whole + (frac + "00")[:2])
+    return int(text + "00")
+
+
+def _str(element):
+    if element.get(_XSI_NIL) is not None:
+        return _NIL
+    text = element.text
+    # Fixed-width fields (dates, ids) are sliced downstream, so padded
+    # values must not survive extraction.
+    return text.strip() if text else text
+
+
+def _struct(fields):
+    def convert(element):
+        tree = {}
+        get_field = fields.get
+        for child in element:
+            entry = get_field(child.tag)
+            if entry is None:
+                continue
+            converter, repeated = entry
+            value = converter(child)
+            if repeated:
+                values = tree.get(child.tag)
+                if values is None:
+                    tree[child.tag] = values = []
+                values.append(value)
+            else:
+                tree[child.tag] = value
+        # The schema-driven decoder yields None for empty content.
+        return tree if tree else None
+
+    return convert
+
+_cv_KoteretKovetz = _struct({"SUG-MIMSHAK": (_int, False), "MISPAR-GIRSAT-XML": (_str, False), "TAARICH-BITZUA": (_str, False), "KOD-SVIVAT-AVODA": (_int, False), "KIVUN-MIMSHAK-XML": (_int, False), "KOD-SHOLEACH": (_int, False), "SHEM-SHOLEACH": (_str, False), "KOD-MEZAHE-METAFEL": (_int, False), "SHEM-METAFEL": (_str, False), "MEZAHE-HAAVARA": (_str, False), "MISPAR-HAKOVETZ": (_str, False)})
+_cv_YeshutLakoach = _struct({"SUG-MEZAHE-LAKOACH": (_int, False), "MISPAR-ZIHUY-LAKOACH": (_str, False), "SHEM-PRATI": (_str, False), "SHEM-MISHPACHA-KODEM": (_str, False), "SHEM-MISHPACHA": (_str, False), "MIN": (_int, False), "TAARICH-LEYDA": (_str, False), "PTIRA": (_int, False), "TAARICH-PTIRA": (_str, False), "MATZAV-MISHPACHTI": (_int, False), "ERETZ": (_str, False), "SHEM-YISHUV": (_str, False), "SEMEL-YESHUV": (_int, False), "SHEM-RECHOV": (_str, False), "MISPAR-BAIT": (_str, False), "MISPAR-KNISA": (_str, False), "MISPAR-DIRA": (_int, False), "MIKUD": (_int, False), "TA-DOAR": (_int, False), "MISPAR-TELEPHONE-KAVI": (_str, False), "MISPAR-SHLUCHA": (_str, False), "MISPAR-CELLULARI": (_str, False), "MISPAR-FAX": (_str, False), "E-MAIL": (_str, False), "HEAROT": (_str, False), "MISPAR-YELADIM": (_int, False)})
+_cv_KtovetLemishloach = _struct({"ERETZ": (_str, False), "SHEM-YISHUV": (_str, False), "SEMEL-YESHUV": (_int, False), "SHEM-RECHOV": (_str, False), "MISPAR-BAIT": (_str, False), "MISPAR-KNISA": (_str, False), "MISPAR-DIRA": (_int, False), "MIKUD": (_int, False), "TA-DOAR": (_int, False)})
+_cv_NetuneiAmitOmevutach = _struct({"KOD-ZIHUY-LAKOACH": (_int, False), "MISPAR-ZIHUY": (_str, False)})
+_cv_Sheer = _struct({"SUG-ZIKA": (_int, False), "KOD-ZIHUI-SHEERIM": (_int, False), "MISPAR-ZIHUY-SHEERIM": (_str, False), "SHEM-PRATI-SHEERIM": (_str, False), "SHEM-MISHPACHA-SHEERIM": (_str, False), "SHEM-MISHPAHA-KODEM": (_str, False), "MIN": (_int, False), "TAARICH-LEIDA": (_str, False)})
+_cv_NetuneiSheerim = _struct({"Sheer": (_cv_Sheer, True)})
+_cv_MaslulBituach = _struct({"MASLUL-BITUACH-BAKEREN-PENSIA": (_str, False), "SHEM-MASLUL-HABITUAH": (_str, False)})
+_cv_PerutShiabudIkul = _struct({"HUTAL-SHIABUD": (_int, False), "HUTAL-IKUL": (_int, False)})
+_cv_Halvaa = _struct({"YESH-HALVAA-BAMUTZAR": (_int, False), "RAMAT-HALVAA": (_int, False), "MISDAR-SIDURI-SHEL-HAHALVAA": (_str, False), "SCHUM-HALVAA": (_cents, False), "TAARICH-KABALAT-HALVAA": (_str, False), "TAARICH-SIYUM-HALVAA": (_str, False), "YITRAT-HALVAA": (_cents, False), "TKUFAT-HALVAA": (_int, False), "RIBIT": (_cents, False), "SUG-RIBIT": (_int, False), "SUG-HATZNMADA": (_int, False), "TADIRUT-HECHZER-HALVAA": (_int, False), "SUG-HECHZER": (_int, False), "SCHUM-HECHZER-TKUFATI": (_cents, False)})
+_cv_PirteyTvia = _struct({"YESH-TVIA": (_int, False), "MISPAR-TVIA-BE-YATZRAN": (_int, False), "MISPAR-KISUI-BE-YATZRAN": (_str, False), "SHEM-KISUI-BE-YATZRAN": (_str, False), "SUG-HATVIAA": (_int, False), "OFEN-TASHLUM": (_int, False), "KOD-STATUS-TVIAA": (_int, False), "TAARICH-STATUS-TVIA": (_str, False), "TAARICH-TECHILAT-TASHLUM": (_str, False), "ACHUZ-MEUSHAR-O-K-A-SHICHRUR": (_cents, False), "SCHUM-TVIA-MEUSHAR": (_cents, False), "ACHUZ-NECHUT": (_cents, False)})
+_cv_PerutMitryot = _struct({"KAYAM-KISUY-BITUCHI-COLECTIVI-LEAMITIM": (_int, False), "SHEM-MEVATACHAT": (_str, False), "TAARICH-TCHILAT-HABITUACH": (_str, False), "TAARICH-TOM-TKUFAT-HABITUAH": (_str, False), "KOD-SUG-MUTZAR-BITUACH": (_int, False), "SCHUM-BITUACH": (_cents, False), "ALUT-KISUI": (_cents, False), "MESHALEM-DMEI-HABITUAH": (_int, False), "TADIRUT-HATSHLUM": (_int, False), "HAIM-NECHTAM-TOFES-HITZTARFUT": (_int, False)})
+_cv_Kupa = _struct({"SUG-KUPA": (_int, False), "SCHUM-KITZVAT-ZIKNA": (_cents, False), "KITZVAT-HODSHIT-TZFUYA": (_cents, False), "ACHUZ-TSUA-BATACHAZIT": (_cents, False), "TOTAL-ITRA-TZFUYA-MECHUSHAV-LEHON-IM-PREMIOT": (_cents, False), "TZVIRAT-CHISACHON-TZFUYA-LEHON-LELO-PREMIYOT": (_cents, False), "TOTAL-SCHUM-MTZBR-TZAFUY-LEGIL-PRISHA-MECHUSHAV-LEKITZBA-IM-PREMIYOT": (_cents, False), "TOTAL-SCHUM-MITZVTABER-TZFUY-LEGIL-PRISHA-MECHUSHAV-HAMEYOAD-LEKITZBA-LELO-PREMIYOT": (_cents, False)})
+_cv_Kupot = _struct({"Kupa": (_cv_Kupa, True)})
+_cv_YitraLefiGilPrisha = _struct({"GIL-PRISHA": (_cents, False), "TOTAL-CHISACHON-MITZTABER-TZAFUY": (_cents, False), "TZVIRAT-CHISACHON-CHAZUYA-LELO-PREMIYOT": (_cents, False), "MEKADEM-MOVTACH-LEPRISHA": (_cents, False), "MEKADEM-HAVTACHST-TOCHELET": (_int, False), "MEKADEM-HAVTACHST-TOCHELETPRISHA": (_int, False), "SHEM-MASLOL": (_str, False), "MEKADEM-HAVTACHAT-TSUA": (_int, False), "MEKADEM-HAVTACHAT-TSUATKUFA": (_int, False), "TKUFAT-HAGBALA-BESHANIM": (_cents, False), "TOCHELET-MASHPIA-KITZBA": (_int, False), "TSUA-MASHPIA-KITZBA": (_int, False), "SHEUR-PNS-ZIKNA-TZFUYA": (_cents, False), "Kupot": (_cv_Kupot, False)})
+_cv_Tsua = _struct({"SHEUR-TSUA-NETO": (_cents, False), "SHEUR-TSUA-BRUTO-CHS-1": (_cents, False), "SHEUR-TSUA-MOVTACHAT-MEYOADOT": (_cents, False), "REVACH-HEFSED-BENIKOI-HOZAHOT": (_cents, False), "SIMAN-REVACH-HEFSED": (_int, False), "ACHUZ-TSUA-BRUTO-CHS-2": (_cents, False)})
+_cv_PirteiOved = _struct({"SUG-TOCHNIT-O-CHESHBON": (_int, False), "MPR-MAASIK-BE-YATZRAN": (_str, False), "STATUS-MAASIK": (_int, False), "SUG-BAAL-HAPOLISA-SHE-EINO-HAMEVUTACH": (_int, False), "MISPAR-BAAL-POLISA-SHEEINO-MEVUTAH": (_str, False), "SHEM-BAAL-POLISA-SHEEINO-MEVUTAH": (_str, False)})
+_cv_PirteiHaasaka = _struct({"KOD-CHISHUV-SACHAR-POLISA-O-HESHBON": (_int, False), "SACHAR-POLISA": (_cents, False), "KOD-OFEN-HATZMADA": (_int, False), "TAARICH-MASKORET": (_str, False), "ZAKAUT-LELO-TNAI": (_int, False), "SEIF-14": (_int, False), "TAARICH-TCHILAT-TASHLUM": (_str, False)})
+_cv_PerutHafrashotLePolisa = _struct({"SUG-HAMAFKID": (_int, False), "SUG-HAFRASHA": (_int, False), "ACHUZ-HAFRASHA": (_cents, False), "SCHUM-HAFRASHA": (_cents, False), "TAARICH-MADAD": (_str, False)})
+_cv_PerutMasluleiHashkaa = _struct({"KOD-SUG-MASLUL": (_int, False), "KOD-SUG-HAFRASHA": (_int, False), "ACHUZ-HAFKADA-LEHASHKAA": (_cents, False), "SCHUM-TZVIRA-BAMASLUL": (_cents, False), "SHEM-MASLUL-HASHKAA": (_str, False), "SHEUR-DMEI-NIHUL-HAFKADA": (_cents, False), "SHEUR-DMEI-NIHUL-HISACHON": (_cents, False), "SHEUR-DMEI-NIHUL-HAFKADA-MIVNE": (_cents, False), "SHEUR-DMEI-NIHUL-HISACHON-MIVNE": (_cents, False), "DMEI-NIHUL-ACHERIM": (_cents, False), "TSUA-NETO": (_cents, False), "KOD-MASLUL-HASHKAA": (_str, False)})
+_cv_NetuneiGvia = _struct({"SHEM-MESHALEM": (_str, False), "SUG-TEUDA-MESHALEM": (_int, False), "MISPAR-ZIHUY-MESHALEM": (_str, False), "KOD-EMTZAEI-TASHLUM": (_int, False), "TADIRUT-TASHLUM": (_int, False), "CHODESH-YECHUS": (_int, False), "YOM-GVIYA-BECHODESH": (_int, False), "OFEN-HATZMADAT-GVIA": (_int, False), "ACHUZ-TAT-SHNATIYOT": (_cents, False)})
+_cv_PerutHafkadaAchrona = _struct({"KOD-SUG-HAFKADA": (_int, False), "SUG-HAFRASHA": (_int, False), "SUG-MAFKID": (_int, False), "SACHAR-BERAMAT-HAFKADA": (_cents, False), "SCHUM-HAFKADA-SHESHULAM": (_cents, False), "CHODESH-SACHAR": (_str, False)})
+_cv_PerutPirteiHafkadaAchrona = _struct({"TAARICH-HAFKADA-ACHARON": (_str, False), "TOTAL-HAFKADA": (_cents, False), "HAFKADA-LEHISCHON-A": (_cents, False), "HAFKADA-LEHISCHON-B": (_cents, False), "TAARICH-ERECH-HAFKADA": (_str, False), "SUG-HAFKADA": (_int, False), "TOTAL-HAFKADA-ACHRONA": (_cents, False), "PerutHafkadaAchrona": (_cv_PerutHafkadaAchrona, True)})
+_cv_PirteiHafkadaAchrona = _struct({"PerutPirteiHafkadaAchrona": (_cv_PerutPirteiHafkadaAchrona, True)})
+_cv_PerutHafkadotMetchilatShana = _struct({"TAARICH-ERECH-HAFKADA": (_str, False), "KOD-SUG-HAFKADA": (_int, False), "SUG-HAFRASHA": (_int, False), "SUG-MAFKID": (_int, False), "SCHUM-HAFKADA-SHESHULAM": (_cents, False), "SACHAR-BERAMAT-HAFKADA": (_cents, False), "CHODESH-SACHAR": (_str, False), "ZMAN-PERAON": (_str, False), "KOD-MEZAHE-KOPA-MAAVIRA": (_str, False), "SHEM-KOPA-MAAVIRA": (_str, False), "MOED-KOVEA-NIUD": (_str, False)})
+_cv_HafkadotShnatiyot = _struct({"TOTAL-HAFKADOT-OVED-TAGMULIM-SHANA-NOCHECHIT": (_cents, False), "TOTAL-HAFKADOT-MAAVID-TAGMULIM-SHANA-NOCHECHIT": (_cents, False), "TOTAL-HAFKADOT-PITZUIM-SHANA-NOCHECHIT": (_cents, False)})
+_cv_MeshichaNiud = _struct({"KOD-SUG-PEULA": (_int, False), "RACHIV-NIMSHACH-NUYAD": (_int, False), "SCHOOM-MESHICHA-NIUD": (_cents, False), "TAARICH-BIZOA": (_str, False), "TAARICH-ERECH": (_str, False), "KNAS-MESHICHA-NIUD": (_cents, False), "KOD-MEZAHE-KOPA-MEKABELET": (_str, False), "SHEM-KOPA-MEKABELET": (_str, False), "ILAT-HAAVARA": (_int, False), "MOED-KOVEA": (_str, False)})
+_cv_ChovPigur = _struct({"KAYAM-CHOV-O-PIGUR": (_int, False), "TAARICH-TECHILAT-PIGUR": (_str, False), "TAARICH-TECHILAT-PIGUR-NOCHECHI": (_str, False), "MISPAR-CHODSHEI-PIGUR": (_int, False), "SUG-HOV": (_int, False), "TOTAL-CHOVOT-O-PIGURIM": (_cents, False), "KSAFIM-LO-MESHUYACHIM-MAASIK": (_int, False)})
+_cv_ChovotPigurim = _struct({"ChovPigur": (_cv_ChovPigur, False)})
+_cv_HotzaotBafoalLehodeshDivoach = _struct({"SHEUR-DMEI-NIHUL-HAFKADA": (_cents, False), "TOTAL-DMEI-NIHUL-HAFKADA": (_cents, False), "SHEUR-DMEI-NIHUL-TZVIRA": (_cents, False), "TOTAL-DMEI-NIHUL-TZVIRA": (_cents, False), "SACH-DMEI-NIHUL-ACHERIM": (_cents, False), "HOTZOT-NIHUL-ASHKAOT": (_cents, False), "TOTAL-DMEI-NIHUL-POLISA-O-HESHBON": (_cents, False), "DEMI-AAVARAT-MASLOL": (_cents, False), "DMEI-NIUL-MENAEL-TIKIM": (_cents, False), "MEMOTZA-SHEUR-DMEI-NIHUL-HAFKADA": (_cents, False), "MEMOTZA-TOTAL-DMEI-NIHUL-HAFKADA": (_cents, False), "OFEN-GEVIAT-DMEI-BITUACH": (_int, False), "SACH-DMEI-BITUAH-SHENIGBOO": (_cents, False)})
+_cv_PerutMivneDmeiNihul = _struct({"GOVA-DMEI-NIHUL-NIKBA-AL-PI-HOTZAOT-BAPOAL": (_int, False), "SUG-HOTZAA": (_int, False), "KOD-MASLUL-DMEI-NIHUL": (_str, False), "MEAFYENEI-MASLUL-DMEI-NIHUL": (_int, False), "SHEUR-DMEI-NIHUL": (_cents, False), "TAARICH-IDKUN-SHEUR-DNHL": (_str, False), "DMEI-NIHUL-ACHIDIM": (_int, False), "KOD-MASLUL-HASHKAA-BAAL-DMEI-NIHUL-YECHUDIIM": (_str, False), "OFEN-HAFRASHA": (_int, False), "SCHUM-MAX-DNHL-HAFKADA": (_cents, False), "SACH-DMEI-NIHUL-MASLUL": (_cents, False), "DMEI-NIHUL-ACHERIM": (_cents, False), "KENAS-MESHICHAT-KESAFIM": (_int, False), "KAYEMET-HATAVA": (_int, False), "SUG-HATAVA": (_int, False), "ACHOZ-HATAVA": (_cents, False), "TAARICH-SIUM-HATAVA": (_str, False)})
+_cv_MivneDmeiNihul = _struct({"PerutMivneDmeiNihul": (_cv_PerutMivneDmeiNihul, True)})
+_cv_PerutHotzaot = _struct({"HotzaotBafoalLehodeshDivoach": (_cv_HotzaotBafoalLehodeshDivoach, False), "MivneDmeiNihul": (_cv_MivneDmeiNihul, False)})
+_cv_PerutYitrotLesofShanaKodemet = _struct({"YITRAT-SOF-SHANA": (_cents, False), "ERECH-PIDYON-SOF-SHANA": (_cents, False), "ERECH-MESOLAK-SOF-SHANA": (_cents, False), "YISKON-YITRAT-KESAFIM": (_cents, False)})
+_cv_PerutYitrot = _struct({"KOD-SUG-ITRA": (_int, False), "KOD-SUG-HAFRASHA": (_int, False), "TOTAL-CHISACHON-MTZBR": (_cents, False), "TOTAL-ERKEI-PIDION": (_cents, False)})
+_cv_PerutYitraLeTkufa = _struct({"KOD-TECHULAT-SHICHVA": (_int, False), "TIKRAT-HAFKADA-MUTEVET": (_int, False), "REKIV-ITRA-LETKUFA": (_int, False), "SUG-ITRA-LETKUFA": (_int, False), "SACH-ITRA-LESHICHVA-BESHACH": (_cents, False)})
+_cv_NesilutTag = _struct({"MOED-NEZILUT-TAGMULIM": (_str, False), "YITRAT-KASPEY-TAGMULIM": (_cents, False)})
+_cv_YitrotShonot = _struct({"TZVIRAT-PITZUIM-PTURIM-MAAVIDIM-KODMIM": (_cents, False), "ERECH-PIDION-PITZUIM-LEKITZBA-MAAVIDIM-KODMIM": (_cents, False), "TZVIRAT-PITZUIM-MAAVIDIM-KODMIM-BERETZEF-KITZBA": (_cents, False), "TZVIRAT-PITZUIM-MAAVIDIM-KODMIM-BERETZEF-ZECHUYOT": (_cents, False), "TZVIRAT-PITZUIM-31-12-1999-LEKITZBA": (_cents, False), "ERECH-PIDION-PITZUIM-MAASIK-NOCHECHI": (_cents, False), "ERECH-PIDION-MARKIV-PITZUIM-LEMAS-NOCHECHI": (_cents, False), "ERECH-PIDION-PITZUIM-MAAVIDIM-KODMIM-RETZEF-ZEHUYUT": (_cents, False), "ERECH-PIDION-PITZUIM-LEHON-MAAVIDIM-KODMIM": (_cents, False), "YITRAT-PITZUIM-LELO-HITCHASHBENOT": (_cents, False), "KAYAM-RETZEF-PITZUIM-KITZBA": (_int, False), "KAYAM-RETZEF-ZECHUYOT-PITZUIM": (_int, False)})
+_cv_Yitrot = _struct({"TAARICH-ERECH-TZVIROT": (_str, False), "PerutYitrot": (_cv_PerutYitrot, True), "PerutYitraLeTkufa": (_cv_PerutYitraLeTkufa, True), "NesilutTag": (_cv_NesilutTag, True), "YitrotShonot": (_cv_YitrotShonot, False)})
+_cv_BlockItrot = _struct({"Yitrot": (_cv_Yitrot, False)})
+_cv_PirteiTaktziv = _struct({"PirteiOved": (_cv_PirteiOved, False), "PirteiHaasaka": (_cv_PirteiHaasaka, False), "PerutHafrashotLePolisa": (_cv_PerutHafrashotLePolisa, True), "PerutMasluleiHashkaa": (_cv_PerutMasluleiHashkaa, True), "NetuneiGvia": (_cv_NetuneiGvia, False), "PirteiHafkadaAchrona": (_cv_PirteiHafkadaAchrona, False), "PerutHafkadotMetchilatShana": (_cv_PerutHafkadotMetchilatShana, True), "HafkadotShnatiyot": (_cv_HafkadotShnatiyot, False), "MeshichaNiud": (_cv_MeshichaNiud, True), "ChovotPigurim": (_cv_ChovotPigurim, False), "PerutHotzaot": (_cv_PerutHotzaot, False), "PerutYitrotLesofShanaKodemet": (_cv_PerutYitrotLesofShanaKodemet, False), "BlockItrot": (_cv_BlockItrot, False)})
+_cv_PerutMeyupeKoach = _struct({"KAYAM-MEYUPE-KOACH": (_int, False), "SUG-ZIHUY": (_int, False), "MEYOPE-ZIHUY": (_int, False), "HARSHAA-LEBITZUAE-PEULA": (_int, False), "MISPAR-ZIHUY": (_str, False), "TAARICH-MINUY-SOCHEN": (_str, False), "SHEM-MEYUPE-KOACH": (_str, False)})
+_cv_PirteiMevutach = _struct({"SUG-TEUDA": (_int, False), "MISPAR-ZIHUY-LAKOACH": (_str, False)})
+_cv_SchumeiBituahYesodi = _struct({"KOD-MUTZAR-LEFI-KIDUD-ACHID-LAYESODI": (_str, False), "SUG-HATZMADA-SCHUM-BITUAH": (_int, False), "SUG-HATZMADA-DMEI-BITUAH": (_int, False), "SUG-MASLUL-LEBITUAH": (_int, False), "IND-SCHUM-BITUAH-KOLEL-CHISACHON": (_int, False), "SCHUM-BITUACH-LEMASLUL": (_cents, False), "MISPAR-MASKOROT": (_int, False), "ACHUZ-HAKTZAA-LE-CHISACHON": (_cents, False), "TIKRAT-GAG-HATAM-LEMIKRE-MAVET": (_cents, False), "SCHUM-BITUAH-LEMAVET": (_cents, False)})
+_cv_PirteiKisuiBeMutzar = _struct({"KOD-MIUTZAR-LAKISUY": (_str, False), "SUG-MEVUTACH": (_int, False), "SUG-KISUY-BITOCHI": (_int, False), "TAARICH-TCHILAT-KISUY": (_str, False), "TAARICH-TOM-KISUY": (_str, False), "KOD-NISPACH-KISUY": (_str, False), "SUG-ISUK": (_int, False), "KOLEL-PRENZISA": (_int, False), "KOLEL-SIUD": (_int, False), "KITZBA-ZMUDA-LAMADAD": (_int, False), "NACHUT-MITPATAHAT": (_int, False), "BITUL-KIZUZ-MEMSHALTI": (_int, False), "TAARICH-HAFSAKAT-TASHLUM": (_str, False), "ACHUZ-ME-SCM-BTH-YESODI": (_cents, False), "ACHUZ-MESACHAR": (_cents, False), "OFEN-TASHLUM-SCHUM-BITUACH": (_int, False), "SCHUM-BITUACH": (_cents, False), "TIKRAT-GAG-HATAM-LE-O-K-A": (_cents, False), "ACHUZ-HAGDALAT-GAG-HATAM-O-K-A": (_cents, False), "SCHUM-SHEUR": (_int, False), "SCHUM-BITUH-KAVOA-MISHTANE": (_int, False), "SHEUR-BITUH-KAVOA-MISHTANE": (_int, False), "MESHALEM-HAKISUY": (_int, False), "KOD-ISHUN": (_int, False), "IND-CHITUM": (_int, False), "TAARICH-CHITUM": (_str, False), "HACHRAGA": (_int, False), "SUG-HACHRAGA": (_int, False), "TKUFAT-ACHSHARA": (_int, False), "TKUFAT-HAMTANA-CHODASHIM": (_int, False), "HANACHA": (_int, False), "HATNAYA-LAHANACHA-DMEI-BITUAH": (_int, False), "DMEI-BITUAH-LETASHLUM-BAPOAL": (_cents, False), "SUG-HANACHA-KISUY": (_int, False), "SHIUR-HANACHA-BEKISUI": (_cents, False), "ERECH-HANACHA-BEKISUI": (_cents, False), "HANACHA-MEDUREGET": (_int, False), "TNAEI-HANACHA": (_int, False), "MOED-SIUM-TKUFAT-HANACHA": (_str, False), "TADIRUT-SHINUY-DMEI-HABITUAH-BESHANIM": (_int, False), "TAARICH-IDKUN-HABA-SHEL-DMEI-HABITUAH": (_str, False)})
+_cv_PirteiTosafot = _struct({"TOSEFET-TAARIF": (_int, False), "KOD-SUG-TOSEFET": (_int, False), "SHEUR-TOSEFET": (_cents, False), "PROMIL-TOSEFET": (_cents, False), "TAARICH-TOM-TOSEFET": (_str, False)})
+_cv_Mutav = _struct({"SUG-ZIHUY-MUTAV": (_int, False), "KOD-ZIHUY-MUTAV": (_int, False), "MISPAR-ZIHUY-MUTAV": (_str, False), "SHEM-PRATI-MUTAV": (_str, False), "SHEM-MISHPACHA-MUTAV": (_str, False), "TAARICH-LEIDA-MUTAV": (_str, False), "SUG-ZIKA": (_int, False), "ACHUZ-MUTAV": (_cents, False), "HAGDARAT-MUTAV": (_int, False), "MAHUT-MUTAV": (_int, False)})
+_cv_KisuiBKerenPensia = _struct({"ALUT-KISUI-NECHUT": (_cents, False), "ALUT-KISUI-PNS-SHRM-NECHE": (_cents, False), "SHEUR-KISUY-NECHUT": (_cents, False), "SACHAR-KOVEA-LE-NECHUT-VE-SHEERIM": (_cents, False), "TAARICH-MASKORET-NECHUT-VE-SHEERIM": (_str, False), "SUG-VITOR-SHAERIM": (_int, False), "SACH-PENSIAT-NECHUT": (_cents, False), "NECHUT-MITPATAHAT": (_int, False), "VITUR-KISUY-BITUCHI": (_int, False), "ALUT-KISUY-SHEERIM": (_cents, False), "SHIUR-KISUY-YATOM": (_cents, False), "KITZBAT-SHEERIM-LEALMAN-O-ALMANA": (_cents, False), "KITZBAT-SHEERIM-LEYATOM": (_cents, False), "KITZBAT-SHEERIM-LEHORE-NITMACH": (_cents, False), "TAARICH-VITOR-SHEERIM": (_str, False), "TAARICH-CIUM-VITOR-SEERIM": (_str, False), "SHIUR-KISUY-ALMAN-O-ALMANA": (_cents, False), "SHIUR-KISUY-HORE-NITMACH": (_cents, False), "GIL-PRISHA-LEPENSIYAT-ZIKNA": (_cents, False), "MISPAR-HODSHEI-HAVERUT-BEKEREN-HAPENSIYA": (_int, False), "MISPAR-HODSHEI-HAVERUT-MITZ-BEKEREN-HAPENSIYA": (_int, False), "MENAT-PENSIA-TZVURA": (_cents, False), "AHUZ-PENSIYA-TZVURA": (_cents, False), "TAARICH-TCHILAT-HAVERUT": (_str, False), "TAARICH-ERECH-LANENTUNIM": (_str, False), "HATAVA-BITUCHIT": (_int, False)})
+_cv_Miktsoa_Isuk_Tachviv = _struct({"TACHVIVIM-O-ISUKIM": (_str, False), "KOD-MIKTZOA": (_str, False), "TCHUM-ISUK-CHADASH": (_str, False)})
+_cv_hitpatchutpremia = _struct({"TCHILAT-TKUFA": (_str, False), "TOM-TKUFA": (_str, False), "PREMIA-ZFOYA": (_cents, False)})
+_cv_hitpatchutschusheurmbituh = _struct({"TCHILAT-TKUFA": (_str, False), "TOM-TKUFA": (_str, False), "SHEUR-BITUH-ZFOY": (_cents, False), "SCHUM-BITUH-ZFOY": (_cents, False)})
+_cv_hanachmedureget = _struct({"TCHILAT-TKUFA": (_str, False), "TOM-TKUFA": (_str, False), "SHEUR-HANACHA": (_cents, False), "SCHUM-HANACHA": (_cents, False)})
+_cv_ZihuiKisui = _struct({"MISPAR-KISUI-BE-YATZRAN": (_str, False), "SHEM-KISUI-YATZRAN": (_str, False), "SUG-KISUI-ETZEL-YATZRAN": (_int, False), "MISPAR-POLISA-O-HESHBON-NEGDI": (_str, False), "PirteiMevutach": (_cv_PirteiMevutach, True), "SchumeiBituahYesodi": (_cv_SchumeiBituahYesodi, False), "PirteiKisuiBeMutzar": (_cv_PirteiKisuiBeMutzar, False), "PirteiTosafot": (_cv_PirteiTosafot, True), "Mutav": (_cv_Mutav, True), "KisuiBKerenPensia": (_cv_KisuiBKerenPensia, False), "Miktsoa-Isuk-Tachviv": (_cv_Miktsoa_Isuk_Tachviv, True), "hitpatchutpremia": (_cv_hitpatchutpremia, True), "hitpatchutschusheurmbituh": (_cv_hitpatchutschusheurmbituh, True), "hanachmedureget": (_cv_hanachmedureget, True)})
+_cv_Kisuim = _struct({"ZihuiKisui": (_cv_ZihuiKisui, False)})
+_cv_HeshbonOPolisa = _struct({"ASMACHTA-MEKORIT": (_str, False), "MISPAR-POLISA-O-HESHBON": (_str, False), "SHEM-TOCHNIT": (_str, False), "KIDOD-ACHID": (_str, False), "MPR-MEFITZ-BE-YATZRAN": (_str, False), "TAARICH-NECHONUT": (_str, False), "TAARICH-HITZTARFUT-MUTZAR": (_str, False), "TAARICH-HITZTARFUT-RISHON": (_str, False), "SUG-KEREN-PENSIA": (_int, False), "PENSIA-VATIKA-O-HADASHA": (_int, False), "TAARICH-IDKUN-STATUS": (_str, False), "STATUS-POLISA-O-CHESHBON": (_int, False), "MEVUTACH": (_int, False), "TAARICH-TCHILA-RISK-ZMANI": (_str, False), "TOM-TOKEF-RISK-ZMANI": (_str, False), "SUG-POLISA": (_int, False), "SUG-TOCHNIT-O-CHESHBON": (_int, False), "MADAD-BASIS": (_cents, False), "AZMADA-LEALVAHA": (_int, False), "TAARICH-ACHRON-MOTAV-MUVET": (_str, False), "KOLEL-ZAKAUT-AGACH": (_int, False), "SHIOR-AGACH-MEUADOT": (_cents, False), "AVTACHT-TESOA": (_int, False), "TAARICH-CIUM-AVTACHT-TESOA": (_str, False), "MISPAR-GIMLAOT": (_int, False), "TIKUN-190": (_int, False), "KAYAM-KISUY-HIZONI": (_int, False), "KISUY-ISHY-KVOZATI": (_int, False), "KtovetLemishloach": (_cv_KtovetLemishloach, False), "NetuneiAmitOmevutach": (_cv_NetuneiAmitOmevutach, False), "NetuneiSheerim": (_cv_NetuneiSheerim, False), "MaslulBituach": (_cv_MaslulBituach, False), "PerutShiabudIkul": (_cv_PerutShiabudIkul, False), "Halvaa": (_cv_Halvaa, True), "PirteyTvia": (_cv_PirteyTvia, True), "PerutMitryot": (_cv_PerutMitryot, True), "YitraLefiGilPrisha": (_cv_YitraLefiGilPrisha, True), "Tsua": (_cv_Tsua, False), "PirteiTaktziv": (_cv_PirteiTaktziv, True), "PerutMeyupeKoach": (_cv_PerutMeyupeKoach, True), "Kisuim": (_cv_Kisuim, True)})
+
+_CONVERTERS = {"KoteretKovetz": _cv_KoteretKovetz, "YeshutLakoach": _cv_YeshutLakoach, "HeshbonOPolisa": _cv_HeshbonOPolisa}
+_STREAM_TAGS = tuple(_CONVERTERS)
+
+def iter_document(xml_doc):
+    """Stream (tag, converted dict) pairs, mirroring checkers.iter_document."""
+    for _event, element in etree.iterparse(xml_doc, events=("end",), tag=_STREAM_TAGS):
+        tag = element.tag
+        yield tag, _CONVERTERS[tag](element)
+        element.clear()
+        while element.getprevious() is not None:
+            del element.getparent()[0]
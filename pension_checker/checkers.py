@@ -1,18 +1,128 @@
 import abc
-import itertools
 import logging
-from collections import defaultdict
 from datetime import datetime
-from decimal import Decimal
-from typing import Any, DefaultDict, Dict, List, Tuple
+from operator import itemgetter
+from typing import Any, Dict, List, Tuple
 
 import xmlschema
+from lxml import etree
 
+from . import _extractor
 from .schema import (
-    HAFRASHA_RANGES_PENSION, SugHafrasha, fix_nil, parse_date, parse_datetime)
+    HAFRASHA_RANGES_PENSION, SUG_HAFRASHA_XSD_MAX, SugHafrasha, fix_nil, parse_date,
+    parse_datetime, to_cents)
+
+try:
+    import numpy
+    from numba import njit
+except ImportError:
+    numpy = None
 
 logger = logging.getLogger(__name__)
 
+HEADERS_PATH = "KoteretKovetz"
+# C-level field accessors for the per-deposit hot loops; one itemgetter call
+# is about twice as fast as the equivalent separate dict lookups.
+_GET_SUG = itemgetter("SUG-HAFRASHA")
+_GET_SCHUM = itemgetter("SCHUM-HAFKADA-SHESHULAM")
+_GET_SACHAR = itemgetter("SACHAR-BERAMAT-HAFKADA")
+_GET_SUG_SCHUM = itemgetter("SUG-HAFRASHA", "SCHUM-HAFKADA-SHESHULAM")
+_GET_SUG_SACHAR_SCHUM = itemgetter(
+    "SUG-HAFRASHA", "SACHAR-BERAMAT-HAFKADA", "SCHUM-HAFKADA-SHESHULAM"
+)
+CUSTOMER_PATH = "YeshutYatzran/Mutzarim/Mutzar/NetuneiMutzar/YeshutLakoach"
+POLICY_PATH = "YeshutYatzran/Mutzarim/Mutzar/HeshbonotOPolisot/HeshbonOPolisa"
+
+
+def iter_document(xml_doc: Any, schema: Any = None) -> Any:
+    """Stream (tag, decoded dict) pairs for the subtrees the checkers consume.
+
+    Without a schema the extractor generated from the XSD does the whole
+    conversion with hard-coded tag tables (see tools/generate_extractor.py);
+    passing a schema keeps the validating xmlschema decode instead. Either
+    way lxml's C parser does the tag filtering, and each matched element is
+    cleared (along with its already-consumed siblings) as soon as it has
+    been yielded, so peak memory stays at one policy rather than the whole
+    document.
+    """
+    if schema is None:
+        yield from _extractor.iter_document(xml_doc)
+        return
+    root_element = schema.elements["Mimshak"]
+    xsd_elements = {
+        path.rsplit("/", 1)[-1]: root_element.find(path)
+        for path in (HEADERS_PATH, CUSTOMER_PATH, POLICY_PATH)
+    }
+    for _event, element in etree.iterparse(
+        xml_doc, events=("end",), tag=tuple(xsd_elements)
+    ):
+        tag = element.tag
+        yield tag, xsd_elements[tag].decode(
+            element, converter=xmlschema.UnorderedConverter, decimal_type=to_cents
+        )
+        element.clear()
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+
+
+def walk(tree: Dict[str, Any], path: str) -> List[Any]:
+    """Collect all nodes matching a slash-separated path in a decoded document."""
+    nodes: List[Any] = [tree]
+    for part in path.split("/"):
+        matches: List[Any] = []
+        for node in nodes:
+            value = node.get(part)
+            if isinstance(value, list):
+                matches.extend(value)
+            elif value is not None:
+                matches.append(value)
+        nodes = matches
+    return nodes
+
+
+_N_SUG = SUG_HAFRASHA_XSD_MAX + 1
+_SUG_RANGES = tuple(
+    (int(sug), sug_min, sug_max) for sug, (sug_min, sug_max) in HAFRASHA_RANGES_PENSION.items()
+)
+
+if numpy is None:
+
+    def sum_by_sug(hafkadot: List[Dict[str, Any]]) -> List[int]:
+        sums = [0] * _N_SUG
+        for hafkada in hafkadot:
+            sug, schum = _GET_SUG_SCHUM(hafkada)
+            # Out-of-range values can only come from invalid documents on the
+            # non-validating path; their sums are never read, so skip them
+            # instead of failing the whole file.
+            if 0 <= sug < _N_SUG:
+                sums[sug] += schum
+        return sums
+
+else:
+
+    @njit(cache=True)
+    def _sum_by_sug_kernel(sug: Any, schum: Any) -> Any:
+        sums = numpy.zeros(_N_SUG, numpy.int64)
+        for i in range(sug.size):
+            value = sug[i]
+            # numba compiles without bounds checks, so an unguarded index
+            # would silently write past the array for out-of-range values;
+            # skip them exactly like the pure-Python fallback does.
+            if 0 <= value < _N_SUG:
+                sums[value] += schum[i]
+        return sums
+
+    def sum_by_sug(hafkadot: List[Dict[str, Any]]) -> List[int]:
+        # Structure-of-arrays layout lets numba compile the histogram
+        # reduction to a tight native loop.
+        count = len(hafkadot)
+        sug = numpy.fromiter(map(_GET_SUG, hafkadot), numpy.int64, count)
+        schum = numpy.fromiter(map(_GET_SCHUM, hafkadot), numpy.int64, count)
+        return list(_sum_by_sug_kernel(sug, schum))
+
+
+_CHECKERS: List[type] = []
+
 
 class Checker(abc.ABC):
     @property
@@ -20,50 +130,67 @@ class Checker(abc.ABC):
     def root_path(self) -> str:
         pass
 
-    def __init__(self, document: xmlschema.XmlDocument) -> None:
-        self.document = document
-        self.problems: List[str] = []
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        _CHECKERS.append(cls)
+
+    def __init__(self) -> None:
+        self.results: List[tuple] = []
         self.headers: Dict[str, Any] = {}
+        self.customer: Dict[str, Any] = {}
+        self._rel_path = self.root_path[len(POLICY_PATH) + 1 :]
+        self._seen = 0
 
-    def check(self) -> List[tuple]:
-        results: List[tuple] = []
-        headers = self.get_path("KoteretKovetz")
-        self.headers["SUG-MIMSHAK"] = headers["SUG-MIMSHAK"]
-        self.headers["TAARICH-BITZUA"] = parse_datetime(headers["TAARICH-BITZUA"])
-
-        for idx, tree in enumerate(self.get_path(self.root_path)):
-            self.check_one(tree)
-            results.extend((self.root_path, idx, p) for p in self.problems)
-            self.problems.clear()
-        return results
+    def load_customer(self, customer: Dict[str, Any]) -> None:
+        self.customer = customer
+
+    def run_one(self, tree: Dict[str, Any]) -> None:
+        self.check_one(tree)
+        self._seen += 1
 
     @abc.abstractmethod
     def check_one(self, tree: Dict[str, Any]) -> None:
         pass
 
     @classmethod
-    def all_checks(cls, xml_doc: Any, schema: Any) -> List[tuple]:
-        document = xmlschema.XmlDocument(xml_doc, schema=schema)
+    def all_checks(cls, xml_doc: Any, schema: Any = None) -> List[tuple]:
+        checkers = [checker_cls() for checker_cls in _CHECKERS]
+        # Checkers sharing a root path run fused over one walk of the subtree
+        # list instead of each re-walking the same policy.
+        by_rel_path: Dict[str, List["Checker"]] = {}
+        for checker in checkers:
+            by_rel_path.setdefault(checker._rel_path, []).append(checker)
+        for tag, tree in iter_document(xml_doc, schema):
+            if tag == "KoteretKovetz":
+                headers = {
+                    "SUG-MIMSHAK": tree["SUG-MIMSHAK"],
+                    "TAARICH-BITZUA": parse_datetime(tree["TAARICH-BITZUA"]),
+                }
+                for checker in checkers:
+                    checker.headers = headers
+            elif tag == "YeshutLakoach":
+                for checker in checkers:
+                    checker.load_customer(tree)
+            else:
+                for rel_path, group in by_rel_path.items():
+                    trees = walk(tree, rel_path) if rel_path else [tree]
+                    for subtree in trees:
+                        for checker in group:
+                            checker.run_one(subtree)
         results: List[tuple] = []
-        for subclass in cls.__subclasses__():
-            checker = subclass(document)
-            checker_results = checker.check()
-            results.extend(checker_results)
+        for checker in checkers:
+            results.extend(checker.results)
         return results
 
-    def assert_(self, check: bool, message: str) -> None:
-        if not check:
-            self.report(message)
-
     def assert_eq(self, left: Any, right: Any, message: str) -> None:
         if left != right:
             self.report(f"{message} ({left} != {right})")
 
     def assert_range(self, min: Any, value: Any, max: Any, message: str) -> None:
         if value < min:
-            self.report(f"{message} ({value:.4} < {min}")
+            self.report(f"{message} ({value} < {min}")
         elif value > max:
-            self.report(f"{message} ({value:.4} > {max}")
+            self.report(f"{message} ({value} > {max}")
 
     def assert_gte(self, left: Any, right: Any, message: str) -> None:
         if left < right:
@@ -82,10 +209,9 @@ class Checker(abc.ABC):
             self.report(f"{message} ({left} >= {right}")
 
     def report(self, message: str) -> None:
-        self.problems.append(message)
-
-    def get_path(self, path: str) -> Any:
-        return self.document.decode(path=path)
+        # Emit the finished result row directly; _seen is the index of the
+        # element currently being checked.
+        self.results.append((self.root_path, self._seen, message))
 
 
 class CheckLastHafkada(Checker):
@@ -98,41 +224,37 @@ class CheckLastHafkada(Checker):
         last_total = tree["TOTAL-HAFKADA"]
         last_perut = tree["PerutHafkadaAchrona"]
         self.assert_eq(
-            sum(x["SCHUM-HAFKADA-SHESHULAM"] for x in last_perut),
+            sum(map(_GET_SCHUM, last_perut)),
             last_total,
             "סכום פירוט הפקדות אחרונות שונה מסך הפקדה אחרונה",
         )
-        salaries = {x["SACHAR-BERAMAT-HAFKADA"] for x in last_perut}
-        self.assert_(
-            len(salaries) == 1,
-            f"שכר לא אחיד בהפקדה אחרונה: {','.join(str(s) for s in salaries)}",
-        )
+        salaries = set(map(_GET_SACHAR, last_perut))
+        if len(salaries) != 1:
+            self.report(f"שכר לא אחיד בהפקדה אחרונה: {','.join(str(s) for s in salaries)}")
 
 
 class CheckHafkadotYtd(Checker):
     root_path = "YeshutYatzran/Mutzarim/Mutzar/HeshbonotOPolisot/HeshbonOPolisa/PirteiTaktziv"
 
     def check_one(self, tree: Dict[str, Any]) -> None:
-        key = lambda x: x["CHODESH-SACHAR"]
-        for month, hafkadot in itertools.groupby(
-            sorted(tree["PerutHafkadotMetchilatShana"], key=key), key=key
-        ):
-            salaries = {x["SACHAR-BERAMAT-HAFKADA"] for x in hafkadot}
-            self.assert_(
-                len(salaries) == 1,
-                f"שכר לא אחיד בהפקדה מחודש שכר {month}: {','.join(str(s) for s in salaries)}",
+        salaries_by_month: Dict[Any, set] = {}
+        for hafkada in tree["PerutHafkadotMetchilatShana"]:
+            salaries_by_month.setdefault(hafkada["CHODESH-SACHAR"], set()).add(
+                hafkada["SACHAR-BERAMAT-HAFKADA"]
             )
+        for month, salaries in salaries_by_month.items():
+            if len(salaries) != 1:
+                self.report(
+                    f"שכר לא אחיד בהפקדה מחודש שכר {month}: "
+                    f"{','.join(str(s) for s in salaries)}"
+                )
 
 
 class CheckHafkadotYtdTotal(Checker):
     root_path = "YeshutYatzran/Mutzarim/Mutzar/HeshbonotOPolisot/HeshbonOPolisa/PirteiTaktziv"
 
     def check_one(self, tree: Dict[str, Any]) -> None:
-        sums: DefaultDict[SugHafrasha, Decimal] = defaultdict(Decimal)
-        hafkadot_ytd = tree["PerutHafkadotMetchilatShana"]
-        for hafkada in hafkadot_ytd:
-            sums[hafkada["SUG-HAFRASHA"]] += hafkada["SCHUM-HAFKADA-SHESHULAM"]
-
+        sums = sum_by_sug(tree["PerutHafkadotMetchilatShana"])
         hafkadot_ytd_total = tree["HafkadotShnatiyot"]
         self.assert_eq(
             sums[SugHafrasha.pitzuim],
@@ -155,19 +277,29 @@ class CheckHafrashotSize(Checker):
     root_path = "YeshutYatzran/Mutzarim/Mutzar/HeshbonotOPolisot/HeshbonOPolisa/PirteiTaktziv"
 
     def check_one(self, tree: Dict[str, Any]) -> None:
-        hafrashot_percentages: Dict[SugHafrasha, Decimal] = {}
-        hafrashot = tree["PerutHafrashotLePolisa"]
-        for p in hafrashot:
+        # SUG-HAFRASHA values are tiny ints, so a bitmask plus a flat list
+        # sized for the XSD's full enumeration beats dict hashing in this
+        # per-policy loop.
+        seen = 0
+        percentages = [0] * _N_SUG
+        for p in tree["PerutHafrashotLePolisa"]:
             sug = p["SUG-HAFRASHA"]
-            self.assert_(sug not in hafrashot_percentages, f"סוג הפרשה {sug} מופיע יותר מפעם אחת")
-            hafrashot_percentages[sug] = p["ACHUZ-HAFRASHA"]
-        for sug, (sug_min, sug_max) in HAFRASHA_RANGES_PENSION.items():
-            if sug not in hafrashot_percentages:
+            bit = 1 << sug
+            if seen & bit:
+                self.report(f"סוג הפרשה {sug} מופיע יותר מפעם אחת")
+            seen |= bit
+            # The bitmask dedupes any non-negative sug, but only XSD-legal
+            # values have a percentage slot; invalid documents on the
+            # non-validating path must not abort the whole file.
+            if sug < _N_SUG:
+                percentages[sug] = p["ACHUZ-HAFRASHA"]
+        for sug, sug_min, sug_max in _SUG_RANGES:
+            if not seen & (1 << sug):
                 self.report(f"חסר סוג הפרשה {sug}")
                 continue
             self.assert_range(
                 sug_min,
-                hafrashot_percentages[sug],
+                percentages[sug],
                 sug_max,
                 f"סוג ההפרשה {sug} מחוץ לטווח המותר",
             )
@@ -180,14 +312,14 @@ class CheckHafrashotSizeInHafkadotYtd(Checker):
     )
 
     def check_one(self, tree: Dict[str, Any]) -> None:
-        sug = tree["SUG-HAFRASHA"]
+        sug, salary, hafkada_schum = _GET_SUG_SACHAR_SCHUM(tree)
         if sug not in HAFRASHA_RANGES_PENSION:
             return
         sug_min, sug_max = HAFRASHA_RANGES_PENSION[sug]
 
-        salary = tree["SACHAR-BERAMAT-HAFKADA"]
-        hafkada_schum = tree["SCHUM-HAFKADA-SHESHULAM"]
-        percentage = hafkada_schum / salary * Decimal(100)
+        # Both sides are in agorot, so the ratio needs scaling by 100 for
+        # percent and by another 100 to match the range bounds' scale.
+        percentage = hafkada_schum * 10000 // salary
 
         self.assert_range(
             sug_min,
@@ -209,11 +341,11 @@ class CheckTotalHafkadaParts(Checker):
         insurance_premium = fix_nil(expenses["SACH-DMEI-BITUAH-SHENIGBOO"], 0)
         dmei_nihul_hafkada = fix_nil(expenses["TOTAL-DMEI-NIHUL-HAFKADA"], 0)
 
-        self.assert_(
-            neto == bruto - insurance_premium - dmei_nihul_hafkada,
-            " סכום הפקדה נטו לא מתאים לברוטו - הוצאות ביטוח - דמי ניהול מהפקדה"
-            f"({neto} != {bruto} - {insurance_premium} - {dmei_nihul_hafkada} ",
-        )
+        if neto != bruto - insurance_premium - dmei_nihul_hafkada:
+            self.report(
+                " סכום הפקדה נטו לא מתאים לברוטו - הוצאות ביטוח - דמי ניהול מהפקדה"
+                f"({neto} != {bruto} - {insurance_premium} - {dmei_nihul_hafkada} "
+            )
 
 
 class CheckNechonutDate(Checker):
@@ -228,10 +360,11 @@ class CheckNechonutDate(Checker):
 class CheckJoinDate(Checker):
     root_path = "YeshutYatzran/Mutzarim/Mutzar/HeshbonotOPolisot/HeshbonOPolisa"
 
-    def check_one(self, tree: Dict[str, Any]) -> None:
-        customer = self.get_path("YeshutYatzran/Mutzarim/Mutzar/NetuneiMutzar/YeshutLakoach")
-        birthday = parse_date(customer["TAARICH-LEYDA"])
+    def load_customer(self, customer: Dict[str, Any]) -> None:
+        # Parse the birthday once per customer rather than once per policy.
+        self.birthday = parse_date(customer["TAARICH-LEYDA"])
 
+    def check_one(self, tree: Dict[str, Any]) -> None:
         join_day = parse_date(tree["TAARICH-HITZTARFUT-MUTZAR"])
 
-        self.assert_gt(join_day, birthday, "תאריך הצטרפות לפני תאריך לידה")
+        self.assert_gt(join_day, self.birthday, "תאריך הצטרפות לפני תאריך לידה")
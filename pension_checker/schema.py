@@ -1,6 +1,7 @@
 from datetime import date, datetime
 from decimal import Decimal
 from enum import IntEnum
+from functools import lru_cache
 from typing import Any
 
 
@@ -12,25 +13,48 @@ class SugHafrasha(IntEnum):
     kh_maavid = 9
 
 
+# The XSD's SUG-HAFRASHA enumeration allows 1-12; SugHafrasha only names the
+# values the checkers care about, so arrays indexed by sug must be sized by
+# this, not by max(SugHafrasha).
+SUG_HAFRASHA_XSD_MAX = 12
+
+
+# Percent bounds in hundredths, matching the scaled ints to_cents() produces
+# at decode time (8.33% -> 833).
 HAFRASHA_RANGES_PENSION = {
-    SugHafrasha.pitzuim: (Decimal("6.0"), Decimal("8.33")),
-    SugHafrasha.tagmulim_oved: (Decimal("6.0"), Decimal("7.0")),
-    SugHafrasha.tagmulim_maavid: (Decimal("6.5"), Decimal("7.5")),
+    SugHafrasha.pitzuim: (600, 833),
+    SugHafrasha.tagmulim_oved: (600, 700),
+    SugHafrasha.tagmulim_maavid: (650, 750),
 }
 
 
 def parse_datetime(date_str: str) -> datetime:
-    return datetime.strptime(date_str, "%Y%m%d%H%M%S")
+    # Fixed-width YYYYMMDDHHMMSS; slicing is several times faster than strptime.
+    return datetime(
+        int(date_str[0:4]),
+        int(date_str[4:6]),
+        int(date_str[6:8]),
+        int(date_str[8:10]),
+        int(date_str[10:12]),
+        int(date_str[12:14]),
+    )
+
+
+@lru_cache(maxsize=4096)
+def parse_date(date_str: str) -> date:
+    # Fixed-width YYYYMMDD; the same dates repeat across policies, so memoize.
+    return date(int(date_str[0:4]), int(date_str[4:6]), int(date_str[6:8]))
 
 
-def parse_date(date_str: str) -> date:
-    return datetime.strptime(date_str, "%Y%m%d").date()
+def to_cents(amount: Decimal) -> int:
+    return int(amount * 100)
 
 
 def fix_nil(element: Any, default: Any = None) -> Any:
-    if isinstance(element, dict):
-        if len(element) == 1:
-            [key] = element
-            if isinstance(key, str) and key.endswith("nil"):
-                return default
+    # Exact type check: the common case is a plain value, not a nil dict,
+    # and type() is cheaper than isinstance() in this hot path.
+    if type(element) is dict and len(element) == 1:
+        key = next(iter(element))
+        if type(key) is str and key.endswith("nil"):
+            return default
     return element
@@ -0,0 +1,190 @@
+"""Generate pension_checker/_extractor.py from the XSD.
+
+The checkers only consume three subtrees (KoteretKovetz, YeshutLakoach and
+HeshbonOPolisa), and the XSD is fixed, so the whole decode step can be
+specialized at build time: this script compiles the schema once with
+xmlschema and emits a module of per-element converter tables that turn lxml
+elements into the same dict trees the schema-driven decoder produces - ints
+for xsd:int, integer hundredths for xsd:decimal, nil markers for xsi:nil -
+without any xmlschema dispatch at runtime.
+
+Rerun after changing the XSD:
+
+    python tools/generate_extractor.py
+"""
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import xmlschema
+from xmlschema.validators import XsdElement, XsdGroup
+
+REPO_ROOT = Path(__file__).parent.parent
+XSD_PATH = REPO_ROOT / "MivneAchid_Holdings_KarnotPensiaHadashot_XSD_Schema_008.xsd"
+OUT_PATH = REPO_ROOT / "pension_checker" / "_extractor.py"
+
+STREAM_PATHS = (
+    "KoteretKovetz",
+    "YeshutYatzran/Mutzarim/Mutzar/NetuneiMutzar/YeshutLakoach",
+    "YeshutYatzran/Mutzarim/Mutzar/HeshbonotOPolisot/HeshbonOPolisa",
+)
+
+INT_PRIMITIVES = {"int", "long", "short", "integer", "byte", "unsignedInt", "unsignedLong"}
+
+PRELUDE = '''\
+"""Specialized extractor for {xsd_name}.
+
+Generated by tools/generate_extractor.py - do not edit by hand.
+
+Converts lxml elements of the subtrees the checkers consume into the same
+dict trees the schema-driven decoder produces, with xsd:decimal values
+scaled to integer hundredths.
+"""
+from lxml import etree
+
+_XSI_NIL = "{{http://www.w3.org/2001/XMLSchema-instance}}nil"
+_NIL = {{"@xsi:nil": "true"}}
+
+
+def _int(element):
+    if element.get(_XSI_NIL) is not None:
+        return _NIL
+    # Numeric XSD types collapse whitespace; real feeds pad values.
+    return int(element.text.strip())
+
+
+def _cents(element):
+    if element.get(_XSI_NIL) is not None:
+        return _NIL
+    text = element.text.strip()
+    if "." in text:
+        whole, _, frac = text.partition(".")
+        return int(whole + (frac + "00")[:2])
+    return int(text + "00")
+
+
+def _str(element):
+    if element.get(_XSI_NIL) is not None:
+        return _NIL
+    text = element.text
+    # Fixed-width fields (dates, ids) are sliced downstream, so padded
+    # values must not survive extraction.
+    return text.strip() if text else text
+
+
+def _struct(fields):
+    def convert(element):
+        tree = {{}}
+        get_field = fields.get
+        for child in element:
+            entry = get_field(child.tag)
+            if entry is None:
+                continue
+            converter, repeated = entry
+            value = converter(child)
+            if repeated:
+                values = tree.get(child.tag)
+                if values is None:
+                    tree[child.tag] = values = []
+                values.append(value)
+            else:
+                tree[child.tag] = value
+        # The schema-driven decoder yields None for empty content.
+        return tree if tree else None
+
+    return convert
+'''
+
+EPILOGUE = '''
+
+def iter_document(xml_doc):
+    """Stream (tag, converted dict) pairs, mirroring checkers.iter_document."""
+    for _event, element in etree.iterparse(xml_doc, events=("end",), tag=_STREAM_TAGS):
+        tag = element.tag
+        yield tag, _CONVERTERS[tag](element)
+        element.clear()
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+'''
+
+
+def simple_kind(xsd_type) -> str:
+    names = []
+    current = xsd_type
+    while current is not None:
+        names.append(current.local_name or "")
+        current = getattr(current, "base_type", None)
+    if any(name in INT_PRIMITIVES for name in names):
+        return "_int"
+    if "decimal" in names:
+        return "_cents"
+    return "_str"
+
+
+def iter_children(xsd_element: XsdElement):
+    content = xsd_element.type.content
+
+    def walk(group):
+        for item in group:
+            if isinstance(item, XsdGroup):
+                yield from walk(item)
+            else:
+                yield item
+
+    if content is not None:
+        yield from walk(content)
+
+
+def emit(xsd_element: XsdElement, emitted: Dict[str, str], lines: List[str]) -> str:
+    """Emit converters for a subtree bottom-up; return this element's converter."""
+    element_type = xsd_element.type
+    if element_type.is_simple() or element_type.has_simple_content():
+        simple = element_type if element_type.is_simple() else element_type.content
+        return simple_kind(simple)
+
+    fields: List[Tuple[str, str, bool]] = []
+    for child in iter_children(xsd_element):
+        converter = emit(child, emitted, lines)
+        repeated = child.max_occurs is None or child.max_occurs > 1
+        fields.append((child.local_name, converter, repeated))
+
+    body = ", ".join(
+        f'"{name}": ({converter}, {repeated})' for name, converter, repeated in fields
+    )
+    definition = f"_struct({{{body}}})"
+
+    name = f"_cv_{xsd_element.local_name.replace('-', '_')}"
+    suffix = 0
+    while name in emitted and emitted[name] != definition:
+        suffix += 1
+        name = f"_cv_{xsd_element.local_name.replace('-', '_')}_{suffix}"
+    if name not in emitted:
+        emitted[name] = definition
+        lines.append(f"{name} = {definition}")
+    return name
+
+
+def main() -> None:
+    schema = xmlschema.XMLSchema(str(XSD_PATH))
+    root_element = schema.elements["Mimshak"]
+
+    emitted: Dict[str, str] = {}
+    lines: List[str] = []
+    converters = {}
+    for path in STREAM_PATHS:
+        xsd_element = root_element.find(path)
+        converters[path.rsplit("/", 1)[-1]] = emit(xsd_element, emitted, lines)
+
+    dispatch = ", ".join(f'"{tag}": {name}' for tag, name in converters.items())
+    lines.append("")
+    lines.append(f"_CONVERTERS = {{{dispatch}}}")
+    lines.append("_STREAM_TAGS = tuple(_CONVERTERS)")
+
+    OUT_PATH.write_text(
+        PRELUDE.format(xsd_name=XSD_PATH.name) + "\n" + "\n".join(lines) + EPILOGUE,
+        encoding="utf-8",
+    )
+    print(f"wrote {OUT_PATH}")
+
+
+if __name__ == "__main__":
+    main()